@@ -1,9 +1,20 @@
-import easyocr
+from functools import lru_cache
+
 import cv2
 
-reader = easyocr.Reader(['en'], gpu=False)
+
+@lru_cache(maxsize=None)
+def get_reader():
+    # easyocr pulls in torch and loads model weights, so build the reader on
+    # first use instead of at import time, and reuse it for every image.
+    import easyocr
+
+    return easyocr.Reader(['en'], gpu=False)
+
 
 def extract_text_from_image(image_path):
     image = cv2.imread(image_path)
-    result = reader.readtext(image, detail=0)
+    if image is None:
+        raise ValueError(f"Could not read image: {image_path}")
+    result = get_reader().readtext(image, detail=0)
     return " ".join(result)
@@ -1,3 +1,4 @@
+import logging
 import pandas as pd
 import os
 import sys
@@ -8,6 +9,8 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 from preprocess import preprocess_text, extract_parameters
 from easyocr_extractor import extract_text_from_image
 
+logging.basicConfig(level=logging.INFO)
+
 # Path to your single image
 image_path = r"C:\Users\parth\Documents\virtual intern\lbmaske\BLR-0425-PA-0039192_05c45741fa5d4b5180df06f200423a00__2_files_merged__26-04-2025_0430-01_PM@E.pdf_page_104.png"
 
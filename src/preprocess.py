@@ -1,44 +1,45 @@
+import logging
 import re
 
+log = logging.getLogger(__name__)
+
+# Compiled once at import; extract_parameters runs these against every report.
+PARAMETER_PATTERNS = {
+    "Hemoglobin": re.compile(r'hemoglobin\s*[:\-]?\s*(\d+\.?\d*)\s*(g/dl)?', re.IGNORECASE),
+    "Total WBC Count": re.compile(r'total wbc count\s*[:\-]?\s*(\d+\.?\d*)\s*(/cumm)?', re.IGNORECASE),
+    "Platelet Count": re.compile(r'platelet count\s*[:\-]?\s*(\d+\.?\d*)\s*(lakhs/cmm)?', re.IGNORECASE),
+    "AST (SGOT)": re.compile(r'(ast|sgot)\s*[:\-]?\s*(\d+\.?\d*)', re.IGNORECASE),
+    "ALT (SGPT)": re.compile(r'(alt|sgpt)\s*[:\-]?\s*(\d+\.?\d*)', re.IGNORECASE),
+    "Glucose": re.compile(r'glucose\s*[:\-]?\s*(\d+\.?\d*)\s*(mg/dl)?', re.IGNORECASE),
+    "LDL": re.compile(r'ldl\s*[:\-]?\s*(\d+\.?\d*)\s*(mg/dl)?', re.IGNORECASE)
+}
+
+WHITESPACE_RE = re.compile(r'\s+')
+DISALLOWED_CHARS_RE = re.compile(r'[^a-z0-9./\s()-]')
+
 def preprocess_text(text):
-    print("\n--- RAW OCR TEXT ---")
-    print(text)
+    log.debug("Raw OCR text: %s", text)
 
     text = text.lower()
-    text = re.sub(r'\s+', ' ', text)
-    text = re.sub(r'[^a-z0-9./\s()-]', ' ', text)
+    text = WHITESPACE_RE.sub(' ', text)
+    text = DISALLOWED_CHARS_RE.sub(' ', text)
 
-    print("\n--- PREPROCESSED TEXT ---")
-    print(text)
+    log.debug("Preprocessed text: %s", text)
 
     return text
 
 
 def extract_parameters(text):
-    patterns = {
-        "Hemoglobin": r'hemoglobin\s*[:\-]?\s*(\d+\.?\d*)\s*(g/dl)?',
-        "Total WBC Count": r'total wbc count\s*[:\-]?\s*(\d+\.?\d*)\s*(/cumm)?',
-        "Platelet Count": r'platelet count\s*[:\-]?\s*(\d+\.?\d*)\s*(lakhs/cmm)?',
-        "AST (SGOT)": r'(ast|sgot)\s*[:\-]?\s*(\d+\.?\d*)',
-        "ALT (SGPT)": r'(alt|sgpt)\s*[:\-]?\s*(\d+\.?\d*)',
-        "Glucose": r'glucose\s*[:\-]?\s*(\d+\.?\d*)\s*(mg/dl)?',
-        "LDL": r'ldl\s*[:\-]?\s*(\d+\.?\d*)\s*(mg/dl)?'
-    }
-
     records = []
 
-    print("\n--- PARAMETER EXTRACTION ---")
-
-    for test_name, pattern in patterns.items():
-        match = re.search(pattern, text, re.IGNORECASE)
+    for test_name, pattern in PARAMETER_PATTERNS.items():
+        match = pattern.search(text)
 
         if match:
             value = match.group(1)
             unit = match.group(2) if match.group(2) else ""
 
-            print(f"[FOUND] {test_name}")
-            print(f"        Value: {value}")
-            print(f"        Unit : {unit}")
+            log.debug("[FOUND] %s: value=%s unit=%s", test_name, value, unit)
 
             records.append({
                 "Test Name": test_name,
@@ -46,6 +47,8 @@ def extract_parameters(text):
                 "Unit": unit
             })
         else:
-            print(f"[NOT FOUND] {test_name}")
+            log.debug("[NOT FOUND] %s", test_name)
+
+    log.info("Extracted %d of %d parameters", len(records), len(PARAMETER_PATTERNS))
 
     return records